@@ -15,6 +15,10 @@
 
 """Adapter for receiving events providing metadata on files"""
 
+import asyncio
+import logging
+from collections import OrderedDict
+
 from ghga_event_schemas import pydantic_ as event_schemas
 from ghga_event_schemas.validation import get_validated_payload
 from hexkit.custom_types import Ascii, JsonObject
@@ -25,6 +29,11 @@ from pydantic_settings import BaseSettings
 from dcs.core import models
 from dcs.ports.inbound.data_repository import DataRepositoryPort
 
+log = logging.getLogger(__name__)
+
+# maximum number of recently registered file IDs remembered for deduplication:
+_RECENTLY_SEEN_MAX = 10_000
+
 
 class EventSubTranslatorConfig(BaseSettings):
     """Config for receiving events providing metadata on files."""
@@ -57,6 +66,27 @@ class EventSubTranslatorConfig(BaseSettings):
         examples=["file_deletion_requested"],
     )
 
+    files_to_register_batch_size: int = Field(
+        1,
+        description=(
+            "The number of file registration events to accumulate before performing"
+            + " a bulk registration. A value of 1 disables batching and registers each"
+            + " file as soon as its event arrives. Values above 1 trade a short"
+            + " durability window for throughput: buffered events are already"
+            + " acknowledged and are flushed at the latest after the batch timeout."
+        ),
+        examples=[1, 100],
+    )
+    files_to_register_batch_timeout: float = Field(
+        1.0,
+        description=(
+            "The maximum number of seconds a buffered file registration event may"
+            + " wait before the current batch is flushed, even if the batch size has"
+            + " not been reached. Only relevant if batching is enabled."
+        ),
+        examples=[1.0, 5.0],
+    )
+
 
 class EventSubTranslator(EventSubscriberProtocol):
     """A triple hexagonal translator compatible with the EventSubscriberProtocol that
@@ -69,19 +99,46 @@ class EventSubTranslator(EventSubscriberProtocol):
         data_repository: DataRepositoryPort,
     ):
         """Initialize with config parameters and core dependencies."""
-        self.topics_of_interest = [config.files_to_register_topic]
-        self.types_of_interest = [config.files_to_register_type]
+        self.topics_of_interest = [
+            config.files_to_register_topic,
+            config.files_to_delete_topic,
+        ]
+        self.types_of_interest = [
+            config.files_to_register_type,
+            config.files_to_delete_type,
+        ]
 
         self._data_repository = data_repository
         self._config = config
 
-    async def _consume_files_to_register(self, *, payload: JsonObject) -> None:
-        """Consume file registration events."""
+        self._register_buffer: list[models.DrsObjectBase] = []
+        # serializes batch flushes so that awaiting a flush also waits for a
+        # concurrently started (timer-driven) flush to finish:
+        self._flush_lock = asyncio.Lock()
+        # flushes a partial batch once the batch timeout expires:
+        self._flush_task: asyncio.Task | None = None
+
+        # short-circuits redelivered registration events before they hit the DB:
+        self._recently_seen: OrderedDict[str, None] = OrderedDict()
+
+        # precomputed dispatch table for O(1) handler lookup per event:
+        self._dispatch = {
+            config.files_to_register_type: self._consume_files_to_register,
+            config.files_to_delete_type: self._consume_file_deletions,
+        }
+
+    @staticmethod
+    def _file_from_payload(*, payload: JsonObject) -> models.DrsObjectBase:
+        """Validate a file registration payload and convert it into a DRS object.
+
+        As the payload has already been validated by get_validated_payload, the
+        model is assembled via model_construct to skip a second validation pass.
+        """
         validated_payload = get_validated_payload(
             payload=payload, schema=event_schemas.FileInternallyRegistered
         )
 
-        file = models.DrsObjectBase(
+        return models.DrsObjectBase.model_construct(
             file_id=validated_payload.file_id,
             decryption_secret_id=validated_payload.decryption_secret_id,
             decrypted_sha256=validated_payload.decrypted_sha256,
@@ -90,7 +147,78 @@ class EventSubTranslator(EventSubscriberProtocol):
             s3_endpoint_alias=validated_payload.s3_endpoint_alias,
         )
 
-        await self._data_repository.register_new_file(file=file)
+    def _mark_recently_seen(self, *, file_id: str) -> None:
+        """Remember a successfully registered file ID, evicting the oldest entry."""
+        self._recently_seen[file_id] = None
+        if len(self._recently_seen) > _RECENTLY_SEEN_MAX:
+            self._recently_seen.popitem(last=False)
+
+    async def _consume_files_to_register(self, *, payload: JsonObject) -> None:
+        """Consume file registration events.
+
+        Redelivered events for recently registered file IDs are skipped without a
+        database roundtrip (Kafka only provides at-least-once delivery). If batching
+        is enabled, the file is buffered and flushed to the data repository once the
+        configured batch size is reached, or by the batch-timeout flush task.
+        """
+        file = self._file_from_payload(payload=payload)
+
+        if file.file_id in self._recently_seen:
+            return
+
+        if self._config.files_to_register_batch_size <= 1:
+            await self._data_repository.register_new_file(file=file)
+            self._mark_recently_seen(file_id=file.file_id)
+            return
+
+        self._register_buffer.append(file)
+
+        if len(self._register_buffer) >= self._config.files_to_register_batch_size:
+            await self._flush_files_to_register()
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_after_timeout())
+
+    async def _flush_after_timeout(self) -> None:
+        """Flush a partial register batch once the batch timeout has expired.
+
+        The buffered events are already acknowledged, so a failed flush must not
+        go unnoticed: the error is logged and the flush is retried after another
+        batch timeout until the buffer (which keeps the failed files) drains.
+        """
+        while True:
+            await asyncio.sleep(self._config.files_to_register_batch_timeout)
+            try:
+                await self._flush_files_to_register()
+            except Exception as error:
+                log.error(
+                    f"Flushing buffered file registrations failed ({error}),"
+                    + " retrying after the batch timeout.",
+                    exc_info=True,
+                )
+                continue
+            return
+
+    async def _flush_files_to_register(self) -> None:
+        """Register all buffered files in one bulk call to the data repository.
+
+        Flushes are serialized through a lock, so awaiting this method also
+        waits for a concurrently in-flight flush to finish. If the bulk
+        registration fails, the files are put back into the buffer so a later
+        flush retries them.
+        """
+        async with self._flush_lock:
+            if not self._register_buffer:
+                return
+
+            files, self._register_buffer = self._register_buffer, []
+            try:
+                await self._data_repository.register_new_files(files=files)
+            except Exception:
+                self._register_buffer = files + self._register_buffer
+                raise
+
+            for file in files:
+                self._mark_recently_seen(file_id=file.file_id)
 
     async def _consume_file_deletions(self, *, payload: JsonObject) -> None:
         """Consume file deletion events."""
@@ -98,6 +226,15 @@ class EventSubTranslator(EventSubscriberProtocol):
             payload=payload, schema=event_schemas.FileDeletionRequested
         )
 
+        # deletions must not overtake buffered registrations - flush the pending
+        # batch (and, via the flush lock, wait out a timer-driven flush that is
+        # already in flight) so e.g. a registration of the same file ID cannot
+        # resurrect the file after this deletion:
+        await self._flush_files_to_register()
+
+        # forget the file ID so a later re-registration is not deduplicated away:
+        self._recently_seen.pop(validated_payload.file_id, None)
+
         await self._data_repository.delete_file(
             file_id=validated_payload.file_id,
         )
@@ -106,9 +243,7 @@ class EventSubTranslator(EventSubscriberProtocol):
         self, *, payload: JsonObject, type_: Ascii, topic: Ascii, key: str
     ) -> None:
         """Consume events from the topics of interest."""
-        if type_ == self._config.files_to_register_type:
-            await self._consume_files_to_register(payload=payload)
-        elif type_ == self._config.files_to_delete_type:
-            await self._consume_file_deletions(payload=payload)
-        else:
+        handler = self._dispatch.get(type_)
+        if handler is None:
             raise RuntimeError(f"Unexpected event of type: {type_}")
+        await handler(payload=payload)
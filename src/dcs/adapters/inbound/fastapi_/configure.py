@@ -19,6 +19,7 @@ from typing import Any
 
 from fastapi import FastAPI
 from fastapi.openapi.utils import get_openapi
+from fastapi.responses import ORJSONResponse
 from ghga_service_commons.api import ApiConfigBase, configure_app
 
 from dcs import __version__
@@ -32,8 +33,15 @@ class DrsApiConfig(ApiConfigBase):
 
 
 def get_openapi_schema(app: FastAPI, *, config: DrsApiConfig) -> dict[str, Any]:
-    """Generates a custom openapi schema for the service"""
-    return get_openapi(
+    """Generates a custom openapi schema for the service.
+
+    The schema is cached on the app instance so the costly schema generation,
+    which walks all routes and pydantic models, only runs once per application.
+    """
+    if app.openapi_schema:
+        return app.openapi_schema
+
+    app.openapi_schema = get_openapi(
         title="Download Controller Service",
         version=__version__,
         description="A service managing access to file objects stored"
@@ -45,20 +53,21 @@ def get_openapi_schema(app: FastAPI, *, config: DrsApiConfig) -> dict[str, Any]:
         tags=[{"name": "DownloadControllerService"}],
         routes=app.routes,
     )
+    return app.openapi_schema
 
 
 def get_configured_app(*, config: DrsApiConfig) -> FastAPI:
     """Create and configure a REST API application."""
-    app = FastAPI()
+    app = FastAPI(default_response_class=ORJSONResponse)
     app.include_router(router)
     configure_app(app, config=config)
 
+    # build the schema eagerly so the first /openapi.json request does not pay
+    # for the full schema traversal:
+    get_openapi_schema(app, config=config)
+
     def custom_openapi():
-        if app.openapi_schema:
-            return app.openapi_schema
-        openapi_schema = get_openapi_schema(app, config=config)
-        app.openapi_schema = openapi_schema
-        return app.openapi_schema
+        return get_openapi_schema(app, config=config)
 
     app.openapi = custom_openapi  # type: ignore [method-assign]
 
@@ -16,11 +16,61 @@
 
 """A collection of http exceptions."""
 
+from typing import ClassVar
+
+from ghga_service_commons.httpyexpect.base_exception import HttpyExpectError
+from ghga_service_commons.httpyexpect.models import HttpExceptionBody
 from ghga_service_commons.httpyexpect.server.exceptions import HttpCustomExceptionBase
 from pydantic import BaseModel
 
 
-class HttpEnvelopeNotFoundError(HttpCustomExceptionBase):
+class _CachedHttpExceptionBase(HttpCustomExceptionBase):
+    """Base class for the exceptions in this module avoiding repeated pydantic work.
+
+    `get_body_model` assembles a new pydantic model class on every call and the
+    base `__init__` validates the (trusted, statically known) payloads of this
+    module on every instantiation. Cache the body model per exception class and
+    construct the exception body without validation instead.
+    """
+
+    _body_model: ClassVar[type[BaseModel] | None] = None
+
+    @classmethod
+    def get_body_model(cls):
+        """Create and return a custom pydantic model describing the exception body.
+
+        The model is only assembled on the first call per class and cached for reuse.
+        """
+        if cls.__dict__.get("_body_model") is None:
+            cls._body_model = super().get_body_model()
+        return cls._body_model
+
+    def __init__(self, *, status_code: int, description: str, data: dict):
+        """Initialize the error with the required metadata, skipping validation.
+
+        The payloads built in this module are static and trusted, so the pydantic
+        validation performed by the base class is not needed here.
+        """
+        self.status_code = status_code
+        self.body = HttpExceptionBody.model_construct(
+            exception_id=self.exception_id, description=description, data=data
+        )
+        HttpyExpectError.__init__(self, description)
+
+    _static_body: ClassVar[HttpExceptionBody]
+
+    def _init_static(self, *, status_code: int) -> None:
+        """Initialize from the class-level precomputed body.
+
+        For exceptions whose description and data are fully static, the body is
+        assembled once at class-definition time and shared across instances.
+        """
+        self.status_code = status_code
+        self.body = self._static_body
+        HttpyExpectError.__init__(self, self._static_body.description)
+
+
+class HttpEnvelopeNotFoundError(_CachedHttpExceptionBase):
     """Thrown when envelope data is not found."""
 
     exception_id = "envelopeNotFoundError"
@@ -34,19 +84,23 @@ class HttpEnvelopeNotFoundError(HttpCustomExceptionBase):
         )
 
 
-class HttpInternalServerError(HttpCustomExceptionBase):
+class HttpInternalServerError(_CachedHttpExceptionBase):
     """Thrown when an error is raised with details that should not be propagated to a client"""
 
     exception_id = "internalServerError"
 
+    _static_body = HttpExceptionBody.model_construct(
+        exception_id="internalServerError",
+        description="Internal Server Error.",
+        data={},
+    )
+
     def __init__(self, *, status_code: int = 500):
         """Construct message and init the exception."""
-        super().__init__(
-            status_code=status_code, description="Internal Server Error.", data={}
-        )
+        self._init_static(status_code=status_code)
 
 
-class HttpExternalAPIError(HttpCustomExceptionBase):
+class HttpExternalAPIError(_CachedHttpExceptionBase):
     """Thrown when communication with an external API produces an error"""
 
     exception_id = "externalAPIError"
@@ -56,7 +110,7 @@ class HttpExternalAPIError(HttpCustomExceptionBase):
         super().__init__(status_code=status_code, description=description, data={})
 
 
-class HttpObjectNotFoundError(HttpCustomExceptionBase):
+class HttpObjectNotFoundError(_CachedHttpExceptionBase):
     """Thrown when a file with given ID could not be found."""
 
     exception_id = "noSuchObject"
@@ -75,15 +129,17 @@ class HttpObjectNotFoundError(HttpCustomExceptionBase):
         )
 
 
-class HttpWrongFileAuthorizationError(HttpCustomExceptionBase):
+class HttpWrongFileAuthorizationError(_CachedHttpExceptionBase):
     """Raised when a work order token cannot be validated"""
 
     exception_id = "wrongFileAuthorizationError"
 
+    _static_body = HttpExceptionBody.model_construct(
+        exception_id="wrongFileAuthorizationError",
+        description="Endpoint file ID did not match file ID announced in work order token.",
+        data={},
+    )
+
     def __init__(self, *, status_code: int = 403):
         """Construct message and init the exception."""
-        super().__init__(
-            status_code=status_code,
-            description="Endpoint file ID did not match file ID announced in work order token.",
-            data={},
-        )
+        self._init_static(status_code=status_code)
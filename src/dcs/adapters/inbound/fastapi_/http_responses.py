@@ -15,10 +15,10 @@
 
 """A collection of http responses."""
 
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 
-class HttpEnvelopeResponse(JSONResponse):
+class HttpEnvelopeResponse(ORJSONResponse):
     """Return base64 encoded envelope bytes"""
 
     response_id = "envelope"
@@ -28,11 +28,14 @@ class HttpEnvelopeResponse(JSONResponse):
         super().__init__(content=envelope, status_code=status_code)
 
 
-class HttpObjectNotInOutboxResponse(JSONResponse):
+class HttpObjectNotInOutboxResponse(ORJSONResponse):
     """Returned, when a file has not been staged to the outbox yet."""
 
     response_id = "objectNotInOutbox"
 
+    # cached headers for the common default, the dict is never mutated downstream:
+    _DEFAULT_HEADERS = {"Retry-After": "300"}
+
     def __init__(
         self,
         *,
@@ -40,5 +43,9 @@ class HttpObjectNotInOutboxResponse(JSONResponse):
         retry_after: int = 300,
     ):
         """Construct message and init the response."""
-        headers = {"Retry-After": str(retry_after)}
+        headers = (
+            self._DEFAULT_HEADERS
+            if retry_after == 300
+            else {"Retry-After": str(retry_after)}
+        )
         super().__init__(content=None, status_code=status_code, headers=headers)
@@ -14,9 +14,11 @@
 # limitations under the License.
 """Module containing the main FastAPI router and all route functions."""
 
-from typing import Annotated
+from types import MappingProxyType
+from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, status
+from fastapi.responses import ORJSONResponse
 
 from dcs.adapters.inbound.fastapi_ import (
     dummies,
@@ -32,36 +34,56 @@ from dcs.ports.inbound.data_repository import DataRepositoryPort
 router = APIRouter()
 
 
-RESPONSES = {
-    "internalServerError": {
-        "description": (
-            "A configuration or external communication error has occurred and details "
-            + "should not be communicated to the client"
-        ),
-        "model": http_exceptions.HttpInternalServerError.get_body_model(),
-    },
-    "noSuchObject": {
-        "description": (
-            "Exceptions by ID:\n- noSuchObject: The requested DrsObject was not found"
-        ),
-        "model": http_exceptions.HttpObjectNotFoundError.get_body_model(),
-    },
-    "objectNotInOutbox": {
-        "description": (
-            "The operation is delayed and will continue asynchronously. "
-            + "The client should retry this same request after the delay "
-            + "specified by Retry-After header."
-        ),
-        "model": http_response_models.DeliveryDelayedModel,
-    },
-    "wrongFileAuthorizationError": {
-        "description": (
-            "Work order token announced wrong file ID."
-            + "\nExceptions by ID:"
-            + "\n- wrongFileAuthorizationError: Mismatch of URL file ID and token file ID"
-        ),
-        "model": http_exceptions.HttpWrongFileAuthorizationError.get_body_model(),
+# frozen so the once-built response specs cannot be mutated after import:
+RESPONSES = MappingProxyType(
+    {
+        "internalServerError": {
+            "description": (
+                "A configuration or external communication error has occurred and details "
+                + "should not be communicated to the client"
+            ),
+            "model": http_exceptions.HttpInternalServerError.get_body_model(),
+        },
+        "noSuchObject": {
+            "description": (
+                "Exceptions by ID:\n- noSuchObject: The requested DrsObject was not found"
+            ),
+            "model": http_exceptions.HttpObjectNotFoundError.get_body_model(),
+        },
+        "objectNotInOutbox": {
+            "description": (
+                "The operation is delayed and will continue asynchronously. "
+                + "The client should retry this same request after the delay "
+                + "specified by Retry-After header."
+            ),
+            "model": http_response_models.DeliveryDelayedModel,
+        },
+        "wrongFileAuthorizationError": {
+            "description": (
+                "Work order token announced wrong file ID."
+                + "\nExceptions by ID:"
+                + "\n- wrongFileAuthorizationError: Mismatch of URL file ID and token file ID"
+            ),
+            "model": http_exceptions.HttpWrongFileAuthorizationError.get_body_model(),
+        },
+    }
+)
+
+# per-route response specs, assembled once at import time:
+_GET_DRS_OBJECT_RESPONSES: dict[int | str, dict[str, Any]] = {
+    status.HTTP_200_OK: {
+        "description": "The DrsObject was found successfully.",
+        "model": DrsObjectResponseModel,
     },
+    status.HTTP_202_ACCEPTED: RESPONSES["objectNotInOutbox"],
+    status.HTTP_403_FORBIDDEN: RESPONSES["wrongFileAuthorizationError"],
+    status.HTTP_404_NOT_FOUND: RESPONSES["noSuchObject"],
+    status.HTTP_500_INTERNAL_SERVER_ERROR: RESPONSES["internalServerError"],
+}
+_GET_ENVELOPE_RESPONSES: dict[int | str, dict[str, Any]] = {
+    status.HTTP_403_FORBIDDEN: RESPONSES["wrongFileAuthorizationError"],
+    status.HTTP_404_NOT_FOUND: RESPONSES["noSuchObject"],
+    status.HTTP_500_INTERNAL_SERVER_ERROR: RESPONSES["internalServerError"],
 }
 
 
@@ -83,14 +105,9 @@ async def health():
     operation_id="getDrsObject",
     tags=["DownloadControllerService"],
     status_code=status.HTTP_200_OK,
-    response_model=DrsObjectResponseModel,
+    response_model=None,
     response_description="The DrsObject was found successfully.",
-    responses={
-        status.HTTP_202_ACCEPTED: RESPONSES["objectNotInOutbox"],
-        status.HTTP_403_FORBIDDEN: RESPONSES["wrongFileAuthorizationError"],
-        status.HTTP_404_NOT_FOUND: RESPONSES["noSuchObject"],
-        status.HTTP_500_INTERNAL_SERVER_ERROR: RESPONSES["internalServerError"],
-    },
+    responses=_GET_DRS_OBJECT_RESPONSES,
 )
 async def get_drs_object(
     object_id: str,
@@ -108,7 +125,9 @@ async def get_drs_object(
 
     try:
         drs_object = await data_repository.access_drs_object(drs_id=object_id)
-        return drs_object
+        # the repository already returns a validated DrsObjectResponseModel, so
+        # serialize it directly instead of re-validating via a response_model:
+        return ORJSONResponse(drs_object.model_dump())
 
     except data_repository.RetryAccessLaterError as retry_later_error:
         # tell client to retry after 5 minutes
@@ -133,11 +152,7 @@ async def get_drs_object(
     status_code=status.HTTP_200_OK,
     response_model=http_response_models.EnvelopeResponseModel,
     response_description="Successfully delivered envelope.",
-    responses={
-        status.HTTP_403_FORBIDDEN: RESPONSES["wrongFileAuthorizationError"],
-        status.HTTP_404_NOT_FOUND: RESPONSES["noSuchObject"],
-        status.HTTP_500_INTERNAL_SERVER_ERROR: RESPONSES["internalServerError"],
-    },
+    responses=_GET_ENVELOPE_RESPONSES,
 )
 async def get_envelope(
     object_id: str,
@@ -15,10 +15,120 @@
 
 """DAO translators for accessing the database."""
 
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Mapping
+from contextlib import AbstractAsyncContextManager
+from typing import Any
+
 from hexkit.protocols.dao import DaoFactoryProtocol
 
 from dcs.core import models
-from dcs.ports.outbound.dao import DrsObjectDaoPort
+from dcs.ports.outbound.dao import DrsObjectDaoPort, ResourceNotFoundError
+
+
+class CachingDrsObjectDao:
+    """A wrapper around the DRS object DAO caching get_by_id results.
+
+    DRS object metadata is effectively immutable once registered, so repeat
+    lookups for hot object IDs (e.g. clients polling while a file is being
+    staged) can be served from memory instead of a database roundtrip. Entries
+    expire after a short TTL and are invalidated on any mutation performed
+    through this DAO.
+    """
+
+    # cache tuning; all call sites use these values:
+    _TTL = 60.0
+    _MAX_SIZE = 10_000
+    _NEGATIVE_TTL = 1.0
+    _NEGATIVE_MAX_SIZE = 1024
+
+    def __init__(self, *, dao: DrsObjectDaoPort):
+        """Wrap the given DAO with a TTL-bound, size-bound cache."""
+        self._dao = dao
+        self._cache: OrderedDict[str, tuple[float, models.AccessTimeDrsObject]] = (
+            OrderedDict()
+        )
+        # short-lived negative cache shielding the database from clients that
+        # hammer unknown IDs (bounded so floods cannot grow memory):
+        self._negative_cache: OrderedDict[str, float] = OrderedDict()
+
+    def _invalidate(self, id_: str) -> None:
+        """Drop the cache entries for the given resource ID, if present."""
+        self._cache.pop(id_, None)
+        self._negative_cache.pop(id_, None)
+
+    async def get_by_id(self, id_: str) -> models.AccessTimeDrsObject:
+        """Get a resource by its ID, served from cache while the entry is fresh."""
+        now = time.monotonic()
+
+        entry = self._cache.get(id_)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+        negative_expiry = self._negative_cache.get(id_)
+        if negative_expiry is not None and negative_expiry > now:
+            raise ResourceNotFoundError(id_=id_)
+
+        try:
+            resource = await self._dao.get_by_id(id_)
+        except ResourceNotFoundError:
+            self._negative_cache[id_] = now + self._NEGATIVE_TTL
+            self._negative_cache.move_to_end(id_)
+            if len(self._negative_cache) > self._NEGATIVE_MAX_SIZE:
+                self._negative_cache.popitem(last=False)
+            raise
+
+        self._cache[id_] = (now + self._TTL, resource)
+        self._cache.move_to_end(id_)
+        if len(self._cache) > self._MAX_SIZE:
+            self._cache.popitem(last=False)
+
+        return resource
+
+    async def insert(self, dto: models.AccessTimeDrsObject) -> None:
+        """Insert a new resource, invalidating any cached entry for its ID."""
+        self._invalidate(dto.file_id)
+        await self._dao.insert(dto)
+
+    async def update(self, dto: models.AccessTimeDrsObject) -> None:
+        """Update an existing resource, invalidating its cached entry."""
+        self._invalidate(dto.file_id)
+        await self._dao.update(dto)
+
+    async def upsert(self, dto: models.AccessTimeDrsObject) -> None:
+        """Insert or update a resource, invalidating its cached entry."""
+        self._invalidate(dto.file_id)
+        await self._dao.upsert(dto)
+
+    async def delete(self, id_: str) -> None:
+        """Delete a resource by its ID, invalidating its cached entry."""
+        self._invalidate(id_)
+        await self._dao.delete(id_)
+
+    async def find_one(
+        self, *, mapping: Mapping[str, Any]
+    ) -> models.AccessTimeDrsObject:
+        """Find exactly one resource matching the mapping (not cached)."""
+        return await self._dao.find_one(mapping=mapping)
+
+    def find_all(
+        self, *, mapping: Mapping[str, Any]
+    ) -> AsyncIterator[models.AccessTimeDrsObject]:
+        """Find all resources matching the mapping (not cached)."""
+        return self._dao.find_all(mapping=mapping)
+
+    @classmethod
+    def with_transaction(cls) -> AbstractAsyncContextManager[DrsObjectDaoPort]:
+        """Transactions are not offered through the caching wrapper.
+
+        The DaoNaturalId protocol defines this as a classmethod, so the wrapper
+        cannot delegate to a wrapped instance here; nothing in this service uses
+        transactional scopes.
+        """
+        raise NotImplementedError(
+            "Transactions are not supported by the caching DRS object DAO."
+        )
 
 
 class DrsObjectDaoConstructor:
@@ -31,8 +141,9 @@ class DrsObjectDaoConstructor:
         """Setup the DAOs using the specified provider of the
         DaoFactoryProtocol.
         """
-        return await dao_factory.get_dao(
+        dao = await dao_factory.get_dao(
             name="drs_objects",
             dto_model=models.AccessTimeDrsObject,
             id_field="file_id",
         )
+        return CachingDrsObjectDao(dao=dao)
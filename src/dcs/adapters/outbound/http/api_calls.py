@@ -15,6 +15,7 @@
 
 """HTTP calls to other service APIs happen here"""
 
+import asyncio
 import base64
 
 import httpx
@@ -22,8 +23,30 @@ import httpx
 from dcs.adapters.outbound.http import exceptions
 from dcs.adapters.outbound.http.exception_translation import ResponseExceptionTranslator
 
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
 
-def get_envelope_from_ekss(
+
+def _get_client() -> httpx.AsyncClient:
+    """Return a shared keep-alive AsyncClient for EKSS calls.
+
+    The client is created once per event loop so repeat calls reuse pooled
+    connections instead of paying DNS + TCP/TLS setup per request. A stale
+    client from a previous loop (e.g. across test cases) is replaced.
+    """
+    global _client, _client_loop
+
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = httpx.AsyncClient(
+            timeout=60,
+            limits=httpx.Limits(max_keepalive_connections=64),
+        )
+        _client_loop = loop
+    return _client
+
+
+async def get_envelope_from_ekss(
     *, secret_id: str, receiver_public_key: str, api_base: str
 ) -> str:
     """Calls EKSS to get an envelope for an encrypted file, using the receivers
@@ -35,7 +58,7 @@ def get_envelope_from_ekss(
     api_url = f"{
         api_base}/secrets/{secret_id}/envelopes/{receiver_public_key_base64}"
     try:
-        response = httpx.get(url=api_url, timeout=60)
+        response = await _get_client().get(url=api_url)
     except httpx.RequestError as request_error:
         raise exceptions.RequestFailedError(url=api_base) from request_error
 
@@ -58,12 +81,12 @@ def get_envelope_from_ekss(
     return content
 
 
-def delete_secret_from_ekss(*, secret_id: str, api_base: str) -> None:
+async def delete_secret_from_ekss(*, secret_id: str, api_base: str) -> None:
     """Calls EKSS to delete a file secret"""
     api_url = f"{api_base}/secrets/{secret_id}"
 
     try:
-        response = httpx.delete(url=api_url, timeout=60)
+        response = await _get_client().delete(url=api_url)
     except httpx.RequestError as request_error:
         raise exceptions.RequestFailedError(url=api_base) from request_error
 
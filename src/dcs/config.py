@@ -15,6 +15,7 @@
 
 """Config Parameter Modeling and Parsing"""
 
+from functools import lru_cache
 from typing import Any
 
 from ghga_service_commons.auth.ghga import AuthConfig
@@ -60,3 +61,13 @@ class Config(
     """Config parameters and their defaults."""
 
     service_name: str = SERVICE_NAME
+
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Return a cached Config instance.
+
+    Parsing and validating all settings sources is only performed on the first
+    call per process; subsequent callers share the same instance.
+    """
+    return Config()  # type: ignore
@@ -23,7 +23,7 @@ from pydantic import BaseModel, EmailStr, Field, field_validator
 class WorkOrderContext(BaseModel):
     """Work order token model"""
 
-    type: Literal["download"] | Literal["upload"] = Field(
+    type: Literal["download", "upload"] = Field(
         ..., title="Type", description="Work type"
     )
     file_id: str = Field(
@@ -15,10 +15,12 @@
 
 """Main business-logic of this service"""
 
+import asyncio
 import contextlib
 import logging
-import re
-import uuid
+import os
+import time
+from collections import OrderedDict
 from datetime import timedelta
 
 from ghga_service_commons.utils import utc_dates
@@ -43,6 +45,19 @@ from dcs.ports.outbound.event_pub import EventPublisherPort
 log = logging.getLogger(__name__)
 
 
+def _new_object_id() -> str:
+    """Generate a random object ID in version-4 UUID format.
+
+    Equivalent to str(uuid.uuid4()), but formats the urandom bytes directly to
+    skip the UUID object construction on the event ingestion hot path.
+    """
+    raw = bytearray(os.urandom(16))
+    raw[6] = (raw[6] & 0x0F) | 0x40  # version 4
+    raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 4122 variant
+    hex_ = raw.hex()
+    return f"{hex_[:8]}-{hex_[8:12]}-{hex_[12:16]}-{hex_[16:20]}-{hex_[20:]}"
+
+
 class DataRepositoryConfig(BaseSettings):
     """Config parameters needed for the DataRepository."""
 
@@ -79,7 +94,12 @@ class DataRepositoryConfig(BaseSettings):
     @classmethod
     def check_server_uri(cls, value: str):
         """Checks the drs_server_uri."""
-        if not re.match(r"^drs://.+/$", value):
+        # plain string checks instead of a regex, the grammar is trivial:
+        if not (
+            value.startswith("drs://")
+            and value.endswith("/")
+            and len(value) > len("drs:///")
+        ):
             message = (
                 "The drs_server_uri has to start with 'drs://' and end with '/'"
                 + f", got : {value}"
@@ -105,38 +125,81 @@ class DataRepository(DataRepositoryPort):
         self._event_publisher = event_publisher
         self._drs_object_dao = drs_object_dao
         self._object_storages = object_storages
+        # bind the URI prefix once, _get_drs_uri runs for every access and publish:
+        self._drs_uri_prefix = config.drs_server_uri
+        # presigned URLs are reused while at least half of their validity window
+        # remains, keyed by object ID within a coarse time bucket:
+        self._presigned_url_cache: OrderedDict[str, tuple[int, str]] = OrderedDict()
+        # for_alias constructs a fresh storage client per call - resolve each
+        # alias once and reuse the instance on all subsequent lookups:
+        self._storage_by_alias: dict[str, tuple[str, ObjectStorageProtocol]] = {}
+
+    def _storage_for_alias(self, *, alias: str) -> tuple[str, ObjectStorageProtocol]:
+        """Resolve the bucket ID and object storage instance for a storage alias.
+
+        Raises a StorageAliasNotConfiguredError if the alias is unknown.
+        """
+        try:
+            return self._storage_by_alias[alias]
+        except KeyError:
+            pass
+
+        try:
+            entry = self._object_storages.for_alias(alias)
+        except KeyError as exc:
+            storage_alias_not_configured = self.StorageAliasNotConfiguredError(
+                alias=alias
+            )
+            log.critical(storage_alias_not_configured)
+            raise storage_alias_not_configured from exc
+
+        self._storage_by_alias[alias] = entry
+        return entry
 
     def _get_drs_uri(self, *, drs_id: str) -> str:
         """Construct DRS URI for the given DRS ID."""
-        return f"{self._config.drs_server_uri}{drs_id}"
+        return self._drs_uri_prefix + drs_id
 
-    def _get_model_with_self_uri(
-        self, *, drs_object: models.DrsObject
-    ) -> models.DrsObjectWithUri:
-        """Add the DRS self URI to an DRS object."""
-        return models.DrsObjectWithUri(
-            **drs_object.model_dump(),
-            self_uri=self._get_drs_uri(drs_id=drs_object.file_id),
-        )
+    async def _get_presigned_url(
+        self, *, object_storage, bucket_id: str, object_id: str
+    ) -> str:
+        """Return a presigned download URL for the given object.
 
-    async def _get_access_model(
-        self,
-        *,
-        drs_object: models.DrsObject,
-        object_storage: ObjectStorageProtocol,
-        bucket_id: str,
-    ) -> models.DrsObjectWithAccess:
-        """Get a DRS Object model with access information."""
-        access_url = await object_storage.get_object_download_url(
+        A freshly signed URL is cached and reused while at least half of its
+        validity window remains, so hot objects skip repeated signing work.
+        """
+        expires_after = self._config.presigned_url_expires_after
+        time_bucket = int(time.monotonic() // max(expires_after // 2, 1))
+
+        entry = self._presigned_url_cache.get(object_id)
+        if entry is not None and entry[0] == time_bucket:
+            return entry[1]
+
+        url = await object_storage.get_object_download_url(
             bucket_id=bucket_id,
-            object_id=drs_object.object_id,
-            expires_after=self._config.presigned_url_expires_after,
+            object_id=object_id,
+            expires_after=expires_after,
         )
 
-        return models.DrsObjectWithAccess(
-            **drs_object.model_dump(),
+        self._presigned_url_cache[object_id] = (time_bucket, url)
+        self._presigned_url_cache.move_to_end(object_id)
+        if len(self._presigned_url_cache) > 1024:
+            self._presigned_url_cache.popitem(last=False)
+
+        return url
+
+    def _get_model_with_self_uri(
+        self, *, drs_object: models.DrsObject
+    ) -> models.DrsObjectWithUri:
+        """Add the DRS self URI to an DRS object.
+
+        The input model is already validated and the URI is derived from the
+        validated server URI config, so the enriched copy is assembled without
+        a dump/validate roundtrip.
+        """
+        return models.DrsObjectWithUri.model_construct(
+            **drs_object.__dict__,
             self_uri=self._get_drs_uri(drs_id=drs_object.file_id),
-            access_url=access_url,
         )
 
     async def access_drs_object(self, *, drs_id: str) -> models.DrsObjectResponseModel:
@@ -153,27 +216,36 @@ class DataRepository(DataRepositoryPort):
             log.error(drs_object_not_found)
             raise drs_object_not_found from error
 
-        drs_object = models.DrsObject(
-            **drs_object_with_access_time.model_dump(exclude={"last_accessed"})
+        # narrow the already validated DB model without a dump/validate roundtrip:
+        drs_object = models.DrsObject.model_construct(
+            **{
+                field: getattr(drs_object_with_access_time, field)
+                for field in models.DrsObject.model_fields
+            }
         )
 
         drs_object_with_uri = self._get_model_with_self_uri(drs_object=drs_object)
 
-        storage_alias = drs_object.s3_endpoint_alias
+        bucket_id, object_storage = self._storage_for_alias(
+            alias=drs_object.s3_endpoint_alias
+        )
 
+        # check if the file corresponding to the DRS object is already in the
+        # outbox; the size lookup doubles as the existence check, saving a
+        # separate HEAD roundtrip (the CLI needs the encrypted size to download
+        # all file parts correctly):
         try:
-            bucket_id, object_storage = self._object_storages.for_alias(storage_alias)
-        except KeyError as exc:
-            storage_alias_not_configured = self.StorageAliasNotConfiguredError(
-                alias=storage_alias
+            encrypted_size = await object_storage.get_object_size(
+                bucket_id=bucket_id, object_id=drs_object.object_id
             )
-            log.critical(storage_alias_not_configured)
-            raise storage_alias_not_configured from exc
-
-        # check if the file corresponding to the DRS object is already in the outbox:
-        if not await object_storage.does_object_exist(
-            bucket_id=bucket_id, object_id=drs_object.object_id
-        ):
+        except object_storage.BucketNotFoundError as error:
+            # a missing outbox bucket is a deployment issue, not a staging state:
+            storage_misconfigured = self.StorageAliasNotConfiguredError(
+                alias=drs_object.s3_endpoint_alias
+            )
+            log.critical(storage_misconfigured)
+            raise storage_misconfigured from error
+        except object_storage.ObjectNotFoundError:
             log.info(f"File not in outbox for '{drs_id}'. Request staging...")
             # publish an event to request a stage of the corresponding file:
             await self._event_publisher.unstaged_download_requested(
@@ -181,32 +253,37 @@ class DataRepository(DataRepositoryPort):
                 target_bucket_id=bucket_id,
             )
 
-            # instruct to retry later:
+            # instruct to retry later (the not-found cause is intentionally
+            # swallowed, not-in-outbox is an expected state, not an error):
             raise self.RetryAccessLaterError(
                 retry_after=self._config.retry_access_after
-            )
+            ) from None
 
         # Successfully staged, update access information now
         log.debug(f"Updating access time of for '{drs_id}'.")
         drs_object_with_access_time.last_accessed = utc_dates.now_as_utc()
-        await self._drs_object_dao.update(drs_object_with_access_time)
 
-        drs_object_with_access = await self._get_access_model(
-            drs_object=drs_object,
-            object_storage=object_storage,
-            bucket_id=bucket_id,
-        )
-
-        # publish an event indicating the served download:
-        await self._event_publisher.download_served(
-            drs_object=drs_object_with_uri,
-            target_bucket_id=bucket_id,
+        # The presigned URL, the access-time update, and the download-served
+        # event are independent of each other - overlap the roundtrips instead
+        # of awaiting them sequentially:
+        access_url, _, _ = await asyncio.gather(
+            self._get_presigned_url(
+                object_storage=object_storage,
+                bucket_id=bucket_id,
+                object_id=drs_object.object_id,
+            ),
+            self._drs_object_dao.update(drs_object_with_access_time),
+            self._event_publisher.download_served(
+                drs_object=drs_object_with_uri,
+                target_bucket_id=bucket_id,
+            ),
         )
         log.info(f"Sent download served event for '{drs_id}'.")
 
-        # CLI needs to have the encrypted size to correctly download all file parts
-        encrypted_size = await object_storage.get_object_size(
-            bucket_id=bucket_id, object_id=drs_object.object_id
+        drs_object_with_access = models.DrsObjectWithAccess.model_construct(
+            **drs_object.__dict__,
+            self_uri=drs_object_with_uri.self_uri,
+            access_url=access_url,
         )
         return drs_object_with_access.convert_to_drs_response_model(size=encrypted_size)
 
@@ -217,6 +294,49 @@ class DataRepository(DataRepositoryPort):
         for storage_alias in object_storages_config.object_storages:
             await self.cleanup_outbox(storage_alias=storage_alias)
 
+    async def _delete_expired_objects(
+        self,
+        *,
+        object_storage: ObjectStorageProtocol,
+        bucket_id: str,
+        storage_alias: str,
+        expired_ids: list[str],
+    ) -> None:
+        """Delete the given expired objects from the outbox bucket.
+
+        The deletes are independent S3 calls and run concurrently, bounded by a
+        semaphore so the fan-out stays within S3 request-rate limits. The first
+        storage error is surfaced as a CleanupError.
+        """
+        semaphore = asyncio.Semaphore(16)
+
+        async def delete_expired_object(object_id: str) -> None:
+            async with semaphore:
+                log.info(
+                    f"Deleting object '{object_id}' from storage '{
+                        storage_alias}'."
+                )
+                await object_storage.delete_object(
+                    bucket_id=bucket_id, object_id=object_id
+                )
+
+        results = await asyncio.gather(
+            *(delete_expired_object(object_id) for object_id in expired_ids),
+            return_exceptions=True,
+        )
+        for object_id, result in zip(expired_ids, results, strict=True):
+            if isinstance(
+                result,
+                object_storage.ObjectError | object_storage.ObjectStorageProtocolError,
+            ):
+                cleanup_error = self.CleanupError(
+                    object_id=object_id, from_error=result
+                )
+                log.critical(cleanup_error)
+                raise cleanup_error from result
+            if isinstance(result, BaseException):
+                raise result
+
     async def cleanup_outbox(self, *, storage_alias: str):
         """
         Check if files present in the outbox have outlived their allocated time and remove
@@ -230,57 +350,58 @@ class DataRepository(DataRepositoryPort):
             f"Starting outbox cleanup for storage identified by alias '{
                 storage_alias}'."
         )
-        try:
-            bucket_id, object_storage = self._object_storages.for_alias(storage_alias)
-        except KeyError as exc:
-            storage_alias_not_configured = self.StorageAliasNotConfiguredError(
-                alias=storage_alias
-            )
-            log.critical(storage_alias_not_configured)
-            raise storage_alias_not_configured from exc
+        bucket_id, object_storage = self._storage_for_alias(alias=storage_alias)
 
         threshold = utc_dates.now_as_utc() - timedelta(days=self._config.cache_timeout)
 
         # filter to get all files in outbox that should be removed
-        object_ids = await object_storage.list_all_object_ids(bucket_id=bucket_id)
+        object_ids = set(await object_storage.list_all_object_ids(bucket_id=bucket_id))
         log.debug(
             f"Retrieved list of deletion candidates for storage '{
                 storage_alias}'"
         )
 
+        # fetch the metadata of all objects registered for this storage in a
+        # single query instead of one DAO roundtrip per outbox object:
+        drs_objects_by_object_id: dict[str, models.AccessTimeDrsObject] = {}
+        async for stored_object in self._drs_object_dao.find_all(
+            mapping={"s3_endpoint_alias": storage_alias}
+        ):
+            if stored_object.object_id in object_ids:
+                drs_objects_by_object_id[stored_object.object_id] = stored_object
+
+        expired_ids: list[str] = []
+        unregistered_ids: list[str] = []
         for object_id in object_ids:
             try:
-                drs_object = await self._drs_object_dao.find_one(
-                    mapping={"object_id": object_id}
-                )
-            except ResourceNotFoundError as error:
-                cleanup_error = self.CleanupError(object_id=object_id, from_error=error)
-                log.critical(cleanup_error)
-                raise cleanup_error from error
+                drs_object = drs_objects_by_object_id[object_id]
+            except KeyError:
+                # surfaced after the deletions below, so one stray object does
+                # not block the eviction of all expired files:
+                unregistered_ids.append(object_id)
+                continue
 
             # only remove file if last access is later than cache timeout days ago
             if drs_object.last_accessed <= threshold:
-                log.info(
-                    f"Deleting object '{object_id}' from storage '{
-                        storage_alias}'."
-                )
-                try:
-                    await object_storage.delete_object(
-                        bucket_id=bucket_id, object_id=object_id
-                    )
-                except (
-                    object_storage.ObjectError,
-                    object_storage.ObjectStorageProtocolError,
-                ) as error:
-                    cleanup_error = self.CleanupError(
-                        object_id=object_id, from_error=error
-                    )
-                    log.critical(cleanup_error)
-                    raise cleanup_error from error
+                expired_ids.append(object_id)
+
+        await self._delete_expired_objects(
+            object_storage=object_storage,
+            bucket_id=bucket_id,
+            storage_alias=storage_alias,
+            expired_ids=expired_ids,
+        )
+
+        if unregistered_ids:
+            object_id = unregistered_ids[0]
+            not_found = ResourceNotFoundError(id_=object_id)
+            cleanup_error = self.CleanupError(object_id=object_id, from_error=not_found)
+            log.critical(cleanup_error)
+            raise cleanup_error from not_found
 
     async def register_new_file(self, *, file: models.DrsObjectBase):
         """Register a file as a new DRS Object."""
-        object_id = str(uuid.uuid4())
+        object_id = _new_object_id()
 
         with contextlib.suppress(ResourceNotFoundError):
             await self._drs_object_dao.get_by_id(file.file_id)
@@ -290,10 +411,14 @@ class DataRepository(DataRepositoryPort):
             )
             return
 
-        drs_object = models.DrsObject(**file.model_dump(), object_id=object_id)
+        # the file model was validated on ingestion - build the derived models
+        # from a single field-dict without re-validating:
+        drs_object = models.DrsObject.model_construct(
+            **file.__dict__, object_id=object_id
+        )
 
-        file_with_access_time = models.AccessTimeDrsObject(
-            **drs_object.model_dump(),
+        file_with_access_time = models.AccessTimeDrsObject.model_construct(
+            **drs_object.__dict__,
             last_accessed=utc_dates.now_as_utc(),
         )
         # write file entry to database
@@ -309,6 +434,35 @@ class DataRepository(DataRepositoryPort):
         log.info(f"Sent successful registration event for file id '{
                  file.file_id}'.")
 
+    async def register_new_files(self, *, files: list[models.DrsObjectBase]):
+        """Register a batch of files as new DRS Objects in one go.
+
+        The per-file database roundtrips are issued concurrently to amortize the
+        per-message overhead of the event consumer. Only the files whose
+        concurrent registration failed are retried sequentially (after all
+        concurrent registrations have settled), which is safe as registration
+        is idempotent with respect to already existing entries.
+        """
+        results = await asyncio.gather(
+            *(self.register_new_file(file=file) for file in files),
+            return_exceptions=True,
+        )
+
+        failed_files = [
+            file
+            for file, result in zip(files, results, strict=True)
+            if isinstance(result, BaseException)
+        ]
+        if not failed_files:
+            return
+
+        log.warning(
+            f"Bulk registration failed for {len(failed_files)} file(s),"
+            + " retrying them sequentially."
+        )
+        for file in failed_files:
+            await self.register_new_file(file=file)
+
     async def serve_envelope(self, *, drs_id: str, public_key: str) -> str:
         """
         Retrieve envelope for the object with the given DRS ID
@@ -324,7 +478,7 @@ class DataRepository(DataRepositoryPort):
 
         log.info(f"Retrieving file envelope for DRS id '{drs_id}'.")
         try:
-            envelope = get_envelope_from_ekss(
+            envelope = await get_envelope_from_ekss(
                 secret_id=drs_object.decryption_secret_id,
                 receiver_public_key=public_key,
                 api_base=self._config.ekss_base_url,
@@ -364,33 +518,38 @@ class DataRepository(DataRepositoryPort):
             # and has already been deleted before
             return
 
-        # call EKSS to remove file secret from vault
-        with contextlib.suppress(exceptions.SecretNotFoundError):
-            delete_secret_from_ekss(
-                secret_id=drs_object.decryption_secret_id,
-                api_base=self._config.ekss_base_url,
-            )
-            log.debug(f"Successfully deleted secret for '{
-                      file_id}' from EKSS.")
-
         # At this point the alias is contained in the database and this is not a user
         # error, but a configuration issue. Is crashing the REST service ok here or do we
         # need a more graceful solution?
         alias = drs_object.s3_endpoint_alias
-        try:
-            bucket_id, object_storage = self._object_storages.for_alias(alias)
-        except KeyError as exc:
-            storage_alias_not_configured = self.StorageAliasNotConfiguredError(
-                alias=alias
-            )
-            log.critical(storage_alias_not_configured)
-            raise storage_alias_not_configured from exc
+        bucket_id, object_storage = self._storage_for_alias(alias=alias)
 
-        # Try to remove file from S3
-        with contextlib.suppress(object_storage.ObjectNotFoundError):
-            await object_storage.delete_object(
+        # The secret in the EKSS vault and the file object in S3 can be removed
+        # independently - delete both concurrently. The database entry is still
+        # deleted last so that an interrupted deletion is fully repeated on the
+        # next attempt.
+        secret_result, object_result = await asyncio.gather(
+            delete_secret_from_ekss(
+                secret_id=drs_object.decryption_secret_id,
+                api_base=self._config.ekss_base_url,
+            ),
+            object_storage.delete_object(
                 bucket_id=bucket_id, object_id=drs_object.object_id
-            )
+            ),
+            return_exceptions=True,
+        )
+
+        if isinstance(secret_result, BaseException):
+            if not isinstance(secret_result, exceptions.SecretNotFoundError):
+                raise secret_result
+        else:
+            log.debug(f"Successfully deleted secret for '{
+                      file_id}' from EKSS.")
+
+        if isinstance(object_result, BaseException):
+            if not isinstance(object_result, object_storage.ObjectNotFoundError):
+                raise object_result
+        else:
             log.debug(
                 f"Successfully deleted file object for '{
                     file_id}' from object storage identified by '{alias}'."
@@ -17,7 +17,6 @@
 in the api.
 """
 
-import re
 from typing import Literal
 
 from ghga_service_commons.utils import utc_dates
@@ -76,7 +75,9 @@ class DrsObjectWithUri(DrsObject):
     @classmethod
     def check_self_uri(cls, value: str):
         """Checks if the self_uri is a valid DRS URI."""
-        if not re.match(r"^drs://.+/.+", value):
+        # equivalent to the former ^drs://.+/.+ regex: a slash must separate a
+        # non-empty host part from a non-empty id part after the scheme:
+        if not (value.startswith("drs://") and "/" in value[7:-1]):
             raise ValueError(f"The self_uri '{value}' is no valid DRS URI.")
 
         return value
@@ -15,8 +15,10 @@
 
 """Module hosting the dependency injection container."""
 
-from collections.abc import AsyncGenerator, Coroutine
+import contextlib
+from collections.abc import AsyncGenerator, Callable, Coroutine
 from contextlib import asynccontextmanager
+from functools import partial
 from typing import Any, TypeAlias
 
 from fastapi import FastAPI
@@ -35,6 +37,29 @@ from dcs.config import Config
 from dcs.core.auth_policies import WorkOrderContext
 from dcs.core.data_repository import DataRepository
 from dcs.ports.inbound.data_repository import DataRepositoryPort
+from dcs.ports.outbound.dao import ResourceNotFoundError
+from dcs.ports.outbound.event_pub import EventPublisherPort
+
+
+class _UnusedEventPublisher(EventPublisherPort):
+    """Event publisher stand-in for entrypoints that never publish events.
+
+    Any attempt to publish through it is a programming error and raises.
+    """
+
+    async def download_served(self, *, drs_object, target_bucket_id) -> None:
+        raise RuntimeError("This entrypoint must not publish events.")
+
+    async def unstaged_download_requested(
+        self, *, drs_object, target_bucket_id
+    ) -> None:
+        raise RuntimeError("This entrypoint must not publish events.")
+
+    async def file_registered(self, *, drs_object) -> None:
+        raise RuntimeError("This entrypoint must not publish events.")
+
+    async def file_deleted(self, *, file_id) -> None:
+        raise RuntimeError("This entrypoint must not publish events.")
 
 
 @asynccontextmanager
@@ -44,6 +69,11 @@ async def prepare_core(*, config: Config) -> AsyncGenerator[DataRepositoryPort,
     drs_object_dao = await DrsObjectDaoConstructor.construct(dao_factory=dao_factory)
     object_storages = S3ObjectStorages(config=config)
 
+    # warm up the database connection so the first request does not pay the
+    # TCP/TLS handshake of a cold connection pool:
+    with contextlib.suppress(ResourceNotFoundError):
+        await drs_object_dao.get_by_id("__connection_warmup__")
+
     async with KafkaEventPublisher.construct(config=config) as event_pub_provider:
         event_publisher = EventPubTranslator(config=config, provider=event_pub_provider)
 
@@ -55,7 +85,9 @@ async def prepare_core(*, config: Config) -> AsyncGenerator[DataRepositoryPort,
         )
 
 
-OutboxCleaner: TypeAlias = Coroutine[Any, Any, None]
+# zero-argument factory returning the cleanup coroutine; handing out a factory
+# instead of a bare coroutine avoids the never-awaited/double-await footguns:
+OutboxCleaner: TypeAlias = Callable[[], Coroutine[Any, Any, None]]
 
 
 def prepare_core_with_override(
@@ -91,8 +123,16 @@ async def prepare_rest_app(
             config=config, context_class=WorkOrderContext
         ) as auth_context,
     ):
-        app.dependency_overrides[dummies.auth_provider] = lambda: auth_context
-        app.dependency_overrides[dummies.data_repo_port] = lambda: data_repository
+        # async overrides so FastAPI resolves them directly on the event loop
+        # instead of dispatching sync callables to the anyio threadpool:
+        async def get_auth_provider():
+            return auth_context
+
+        async def get_data_repository():
+            return data_repository
+
+        app.dependency_overrides[dummies.auth_provider] = get_auth_provider
+        app.dependency_overrides[dummies.data_repo_port] = get_data_repository
         yield app
 
 
@@ -126,11 +166,23 @@ async def prepare_outbox_cleaner(
     config: Config,
     data_repo_override: DataRepositoryPort | None = None,
 ) -> AsyncGenerator[OutboxCleaner, None]:
-    """Construct and initialize a coroutine that cleans the outbox once invoked.
-    By default, the core dependencies are automatically prepared but you can also
-    provide them using the data_repo_override parameter.
+    """Construct and initialize a callable that cleans the outbox once invoked.
+    By default, a Kafka-free core is prepared (cleanup never publishes events,
+    so the short-lived cron invocation skips the producer bootstrap entirely)
+    but you can also provide the core using the data_repo_override parameter.
     """
-    async with prepare_core_with_override(
-        config=config, data_repo_override=data_repo_override
-    ) as data_repository:
-        yield data_repository.cleanup_outbox_buckets(object_storages_config=config)
+    if data_repo_override:
+        data_repository: DataRepositoryPort = data_repo_override
+    else:
+        dao_factory = MongoDbDaoFactory(config=config)
+        drs_object_dao = await DrsObjectDaoConstructor.construct(
+            dao_factory=dao_factory
+        )
+        data_repository = DataRepository(
+            drs_object_dao=drs_object_dao,
+            object_storages=S3ObjectStorages(config=config),
+            event_publisher=_UnusedEventPublisher(),
+            config=config,
+        )
+
+    yield partial(data_repository.cleanup_outbox_buckets, object_storages_config=config)
@@ -18,18 +18,30 @@
 from ghga_service_commons.api import run_server
 from hexkit.log import configure_logging
 
-from dcs.config import Config
+from dcs.config import Config, get_config
 from dcs.inject import (
     prepare_event_subscriber,
     prepare_outbox_cleaner,
     prepare_rest_app,
 )
 
+_logging_configured = False
+
+
+def _prepare_config() -> Config:
+    """Return the shared Config and configure logging exactly once per process."""
+    global _logging_configured
+
+    config = get_config()
+    if not _logging_configured:
+        configure_logging(config=config)
+        _logging_configured = True
+    return config
+
 
 async def run_rest_app():
     """Run the HTTP REST API."""
-    config = Config()  # type: ignore
-    configure_logging(config=config)
+    config = _prepare_config()
 
     async with prepare_rest_app(config=config) as app:
         await run_server(app=app, config=config)
@@ -37,8 +49,7 @@ async def run_rest_app():
 
 async def consume_events(run_forever: bool = True):
     """Run an event consumer listening to the specified topic."""
-    config = Config()  # type: ignore
-    configure_logging(config=config)
+    config = _prepare_config()
 
     async with prepare_event_subscriber(config=config) as event_subscriber:
         await event_subscriber.run(forever=run_forever)
@@ -46,8 +57,7 @@ async def consume_events(run_forever: bool = True):
 
 async def run_outbox_cleanup():
     """Check if outbox buckets contains files that should be cleaned up and perform clean-up."""
-    config = Config()  # type: ignore
-    configure_logging(config=config)
+    config = _prepare_config()
 
     async with prepare_outbox_cleaner(config=config) as cleanup_outbox:
-        await cleanup_outbox
+        await cleanup_outbox()
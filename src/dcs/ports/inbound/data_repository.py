@@ -122,6 +122,11 @@ class DataRepositoryPort(ABC):
         """Register a file as a new DRS Object."""
         ...
 
+    @abstractmethod
+    async def register_new_files(self, *, files: list[models.DrsObjectBase]):
+        """Register a batch of files as new DRS Objects in one go."""
+        ...
+
     @abstractmethod
     async def serve_envelope(self, *, drs_id: str, public_key: str) -> str:
         """
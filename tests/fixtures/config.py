@@ -17,7 +17,7 @@
 
 from pathlib import Path
 
-from pydantic_settings import BaseSettings
+from pydantic import BaseModel
 
 from dcs.config import Config
 from tests.fixtures.utils import BASE_DIR
@@ -26,7 +26,7 @@ TEST_CONFIG_YAML = BASE_DIR / "test_config.yaml"
 
 
 def get_config(
-    sources: list[BaseSettings] | None = None,
+    sources: list[BaseModel] | None = None,
     default_config_yaml: Path = TEST_CONFIG_YAML,
 ) -> Config:
     """Merges parameters from the default TEST_CONFIG_YAML with params inferred
@@ -31,7 +31,6 @@ __all__ = [
     "generate_work_order_token",
 ]
 
-import json
 from collections.abc import AsyncGenerator
 from dataclasses import dataclass, field
 from datetime import timedelta
@@ -64,7 +63,7 @@ from hexkit.providers.s3.testutils import (
     temp_file_object,
 )
 from jwcrypto.jwk import JWK
-from pydantic_settings import BaseSettings
+from pydantic import BaseModel
 
 from dcs.adapters.outbound.dao import DrsObjectDaoConstructor
 from dcs.config import Config, WorkOrderTokenConfig
@@ -83,6 +82,10 @@ from tests.fixtures.utils import generate_token_signing_keys, generate_work_orde
 
 STORAGE_ALIAS = "test"
 
+# signing keys generated once per session; tests that need a mismatching key
+# call generate_token_signing_keys() directly for a fresh one:
+SIGNING_JWK = generate_token_signing_keys()
+
 EXAMPLE_FILE = models.AccessTimeDrsObject(
     file_id="examplefile001",
     object_id="object001",
@@ -101,7 +104,7 @@ class EndpointAliases:
     fake: str = f"{STORAGE_ALIAS}_fake"
 
 
-class EKSSBaseInjector(BaseSettings):
+class EKSSBaseInjector(BaseModel):
     """Dynamically inject ekss url"""
 
     ekss_base_url: str
@@ -131,7 +134,7 @@ async def joint_fixture(
     kafka: KafkaFixture,
 ) -> AsyncGenerator[JointFixture, None]:
     """A fixture that embeds all other fixtures for API-level integration testing"""
-    jwk = generate_token_signing_keys()
+    jwk = SIGNING_JWK
     auth_key = jwk.export(private_key=False)
 
     # merge configs from different sources with the default one:
@@ -223,7 +226,7 @@ async def populated_fixture(
     )
 
     await joint_fixture.kafka.publish_event(
-        payload=json.loads(file_to_register_event.model_dump_json()),
+        payload=file_to_register_event.model_dump(mode="json"),
         type_=joint_fixture.config.files_to_register_type,
         topic=joint_fixture.config.files_to_register_topic,
     )
@@ -15,6 +15,8 @@
 
 """General testing utilities"""
 
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import TypeAlias
 
@@ -30,28 +32,50 @@ BASE_DIR = Path(__file__).parent.resolve()
 SignedToken: TypeAlias = str
 
 
-def generate_work_order_token(
-    *,
-    file_id: str,
-    jwk: JWK,
-    valid_seconds: int = 30,
-) -> SignedToken:
-    """Generate work order token for testing"""
+@lru_cache(maxsize=8)
+def ekss_url_pattern(base_url: str):
+    """Compile the pattern matching all EKSS request URLs once per base URL."""
+    return re.compile(rf"^{re.escape(base_url)}.*")
+
+
+@lru_cache(maxsize=1)
+def _test_user_pubkey() -> str:
+    """Generate the dummy user public key once per session.
+
+    The actual key material is irrelevant for the tests, so the compute-bound
+    curve25519 keygen does not need to run per token.
+    """
+    return encode_key(generate_key_pair().public)
+
+
+@lru_cache(maxsize=128)
+def _work_order_claims(file_id: str) -> dict:
+    """Build the work order claims for a file ID once per session.
+
+    sign_and_serialize_token copies the claims before adding iat/exp, so the
+    cached dict is safe to share between tokens.
+    """
     # we don't need the actual user pubkey
-    user_pubkey = encode_key(generate_key_pair().public)
-    # generate minimal test token
     wot = auth_policies.WorkOrderContext(
         type="download",
         file_id=file_id,
         user_id="007",
-        user_public_crypt4gh_key=user_pubkey,
+        user_public_crypt4gh_key=_test_user_pubkey(),
         full_user_name="John Doe",
         email="john.doe@test.com",
     )
-    claims = wot.model_dump()
+    return wot.model_dump()
 
+
+def generate_work_order_token(
+    *,
+    file_id: str,
+    jwk: JWK,
+    valid_seconds: int = 30,
+) -> SignedToken:
+    """Generate work order token for testing"""
     signed_token = jwt_helpers.sign_and_serialize_token(
-        claims=claims, key=jwk, valid_seconds=valid_seconds
+        claims=_work_order_claims(file_id), key=jwk, valid_seconds=valid_seconds
     )
     return signed_token
 
@@ -15,7 +15,7 @@
 
 """Tests edge cases not covered by the typical journey test."""
 
-import re
+import asyncio
 from dataclasses import dataclass
 
 import httpx
@@ -33,7 +33,15 @@ from dcs.ports.outbound.dao import DrsObjectDaoPort
 from tests.fixtures.joint import *  # noqa: F403
 from tests.fixtures.joint import EXAMPLE_FILE, JointFixture, PopulatedFixture
 from tests.fixtures.mock_api.app import router
-from tests.fixtures.utils import generate_token_signing_keys, generate_work_order_token
+from tests.fixtures.utils import (
+    ekss_url_pattern,
+    generate_token_signing_keys,
+    generate_work_order_token,
+)
+
+# a signing key deliberately mismatching the joint fixture's key, generated
+# once instead of per test run:
+WRONG_SIGNING_JWK = generate_token_signing_keys()
 
 unintercepted_hosts: list[str] = ["localhost"]
 
@@ -99,8 +107,9 @@ async def test_access_non_existing(joint_fixture: JointFixture):
     file_id = "my-non-existing-id"
 
     work_order_token = generate_work_order_token(file_id=file_id, jwk=joint_fixture.jwk)
-    wrong_jwk = generate_token_signing_keys()
-    wrong_work_order_token = generate_work_order_token(file_id=file_id, jwk=wrong_jwk)
+    wrong_work_order_token = generate_work_order_token(
+        file_id=file_id, jwk=WRONG_SIGNING_JWK
+    )
 
     # test with missing authorization header
     # (should not expose whether the file with the given id exists or not)
@@ -109,28 +118,30 @@ async def test_access_non_existing(joint_fixture: JointFixture):
     )
     assert response.status_code == status.HTTP_403_FORBIDDEN
 
-    # test with authorization header but wrong pubkey
-    response = await joint_fixture.rest_client.get(
-        f"/objects/{file_id}",
-        timeout=5,
-        headers={"Authorization": f"Bearer {wrong_work_order_token}"},
-    )
-    assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
-    # test with correct authorization header but wrong object_id
-    response = await joint_fixture.rest_client.get(
-        f"/objects/{file_id}",
-        timeout=5,
-        headers={"Authorization": f"Bearer {work_order_token}"},
-    )
-    assert response.status_code == status.HTTP_404_NOT_FOUND
-
-    response = await joint_fixture.rest_client.get(
-        f"/objects/{file_id}/envelopes",
-        timeout=5,
-        headers={"Authorization": f"Bearer {work_order_token}"},
+    # the authenticated probes are independent of each other - run them
+    # concurrently:
+    # - authorization header with wrong pubkey
+    # - correct authorization header but wrong object_id (object + envelope)
+    wrong_key_response, object_response, envelope_response = await asyncio.gather(
+        joint_fixture.rest_client.get(
+            f"/objects/{file_id}",
+            timeout=5,
+            headers={"Authorization": f"Bearer {wrong_work_order_token}"},
+        ),
+        joint_fixture.rest_client.get(
+            f"/objects/{file_id}",
+            timeout=5,
+            headers={"Authorization": f"Bearer {work_order_token}"},
+        ),
+        joint_fixture.rest_client.get(
+            f"/objects/{file_id}/envelopes",
+            timeout=5,
+            headers={"Authorization": f"Bearer {work_order_token}"},
+        ),
     )
-    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert wrong_key_response.status_code == status.HTTP_401_UNAUTHORIZED
+    assert object_response.status_code == status.HTTP_404_NOT_FOUND
+    assert envelope_response.status_code == status.HTTP_404_NOT_FOUND
 
 
 @pytest.mark.asyncio
@@ -142,7 +153,7 @@ async def test_deletion_config_error(
     # explicitly handle ekss API calls (and name unintercepted hosts above)
     httpx_mock.add_callback(
         callback=router.handle_request,
-        url=re.compile(rf"^{storage_unavailable_fixture.joint.config.ekss_base_url}.*"),
+        url=ekss_url_pattern(storage_unavailable_fixture.joint.config.ekss_base_url),
     )
 
     data_repository = storage_unavailable_fixture.joint.data_repository
@@ -171,7 +182,7 @@ async def test_drs_config_error(
     # explicitly handle ekss API calls (and name unintercepted hosts above)
     httpx_mock.add_callback(
         callback=router.handle_request,
-        url=re.compile(rf"^{storage_unavailable_fixture.joint.config.ekss_base_url}.*"),
+        url=ekss_url_pattern(storage_unavailable_fixture.joint.config.ekss_base_url),
     )
 
     drs_id = storage_unavailable_fixture.file_id
@@ -0,0 +1,185 @@
+# Copyright 2021 - 2024 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the batched file registration path of the event subscriber.
+
+These tests drive the EventSubTranslator against a stub data repository, so
+they cover the batching behavior (which the integration tests leave disabled
+at the default batch size of 1) without requiring any containers.
+"""
+
+import asyncio
+from typing import cast
+
+import pytest
+
+from dcs.adapters.inbound.event_sub import EventSubTranslator, EventSubTranslatorConfig
+from dcs.core import models
+from dcs.ports.inbound.data_repository import DataRepositoryPort
+
+BATCH_TIMEOUT = 0.05
+
+
+class StubDataRepository:
+    """Stub data repository recording registrations and deletions in order."""
+
+    def __init__(self, *, register_delay: float = 0.0, register_failures: int = 0):
+        self.calls: list[tuple[str, str]] = []
+        self.register_delay = register_delay
+        self.register_failures = register_failures
+
+    async def register_new_file(self, *, file: models.DrsObjectBase):
+        """Record a single file registration."""
+        self.calls.append(("register", file.file_id))
+
+    async def register_new_files(self, *, files: list[models.DrsObjectBase]):
+        """Record a bulk registration, optionally failing or delaying first."""
+        if self.register_failures:
+            self.register_failures -= 1
+            raise RuntimeError("Simulated registration failure.")
+        if self.register_delay:
+            await asyncio.sleep(self.register_delay)
+        self.calls.extend(("register", file.file_id) for file in files)
+
+    async def delete_file(self, *, file_id: str):
+        """Record a file deletion."""
+        self.calls.append(("delete", file_id))
+
+
+def get_translator(
+    *, batch_size: int, data_repository: StubDataRepository
+) -> EventSubTranslator:
+    """Get an EventSubTranslator with batching configured as specified."""
+    config = EventSubTranslatorConfig(
+        files_to_register_topic="internal_file_registry",
+        files_to_register_type="file_registered",
+        files_to_delete_topic="file_deletions",
+        files_to_delete_type="file_deletion_requested",
+        files_to_register_batch_size=batch_size,
+        files_to_register_batch_timeout=BATCH_TIMEOUT,
+    )
+    return EventSubTranslator(
+        config=config, data_repository=cast(DataRepositoryPort, data_repository)
+    )
+
+
+def registration_payload(file_id: str) -> dict:
+    """Build a valid FileInternallyRegistered payload for the given file ID."""
+    return {
+        "s3_endpoint_alias": "test",
+        "file_id": file_id,
+        "object_id": "object001",
+        "bucket_id": "test-outbox",
+        "upload_date": "2024-01-01T00:00:00+00:00",
+        "decrypted_size": 12345,
+        "decrypted_sha256": "0" * 64,
+        "encrypted_part_size": 1,
+        "encrypted_parts_md5": ["some", "checksum"],
+        "encrypted_parts_sha256": ["some", "checksum"],
+        "content_offset": 1234,
+        "decryption_secret_id": "some-secret",
+    }
+
+
+async def consume_registration(translator: EventSubTranslator, file_id: str):
+    """Feed a registration event for the given file ID into the translator."""
+    await translator._consume_validated(
+        payload=registration_payload(file_id),
+        type_="file_registered",
+        topic="internal_file_registry",
+        key=file_id,
+    )
+
+
+async def consume_deletion(translator: EventSubTranslator, file_id: str):
+    """Feed a deletion event for the given file ID into the translator."""
+    await translator._consume_validated(
+        payload={"file_id": file_id},
+        type_="file_deletion_requested",
+        topic="file_deletions",
+        key=file_id,
+    )
+
+
+@pytest.mark.asyncio
+async def test_size_triggered_flush():
+    """Buffered registrations are flushed once the batch size is reached."""
+    data_repository = StubDataRepository()
+    translator = get_translator(batch_size=3, data_repository=data_repository)
+
+    await consume_registration(translator, "file1")
+    await consume_registration(translator, "file2")
+    assert data_repository.calls == []
+
+    await consume_registration(translator, "file3")
+    assert data_repository.calls == [
+        ("register", "file1"),
+        ("register", "file2"),
+        ("register", "file3"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_timeout_triggered_flush():
+    """A partial batch is flushed once the batch timeout has expired."""
+    data_repository = StubDataRepository()
+    translator = get_translator(batch_size=10, data_repository=data_repository)
+
+    await consume_registration(translator, "file1")
+    assert data_repository.calls == []
+
+    await asyncio.sleep(BATCH_TIMEOUT * 3)
+    assert data_repository.calls == [("register", "file1")]
+
+
+@pytest.mark.asyncio
+async def test_deletion_flushes_buffered_registration():
+    """A deletion event flushes buffered registrations before it is processed."""
+    data_repository = StubDataRepository()
+    translator = get_translator(batch_size=10, data_repository=data_repository)
+
+    await consume_registration(translator, "file1")
+    await consume_deletion(translator, "file1")
+
+    assert data_repository.calls == [("register", "file1"), ("delete", "file1")]
+
+
+@pytest.mark.asyncio
+async def test_deletion_waits_for_inflight_flush():
+    """A deletion event waits for a timer-driven flush that is already awaiting
+    the bulk registration, so the deletion cannot be overtaken by it.
+    """
+    data_repository = StubDataRepository(register_delay=BATCH_TIMEOUT * 4)
+    translator = get_translator(batch_size=10, data_repository=data_repository)
+
+    await consume_registration(translator, "file1")
+    # let the flush task fire and block inside register_new_files:
+    await asyncio.sleep(BATCH_TIMEOUT * 2)
+    assert data_repository.calls == []
+
+    await consume_deletion(translator, "file1")
+    assert data_repository.calls == [("register", "file1"), ("delete", "file1")]
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_is_retried():
+    """A failed timer-driven flush keeps the buffered files and retries them."""
+    data_repository = StubDataRepository(register_failures=1)
+    translator = get_translator(batch_size=10, data_repository=data_repository)
+
+    await consume_registration(translator, "file1")
+    await asyncio.sleep(BATCH_TIMEOUT * 4)
+
+    assert data_repository.calls == [("register", "file1")]
@@ -16,7 +16,6 @@
 """Tests typical user journeys"""
 
 import json
-import re
 
 import httpx
 import pytest
@@ -32,7 +31,7 @@ from pytest_httpx import HTTPXMock, httpx_mock  # noqa: F401
 from tests.fixtures.joint import *  # noqa: F403
 from tests.fixtures.joint import CleanupFixture, PopulatedFixture
 from tests.fixtures.mock_api.app import router
-from tests.fixtures.utils import generate_work_order_token
+from tests.fixtures.utils import ekss_url_pattern, generate_work_order_token
 
 unintercepted_hosts: list[str] = ["localhost"]
 
@@ -59,7 +58,7 @@ async def test_happy_journey(
     # explicitly handle ekss API calls (and name unintercepted hosts above)
     httpx_mock.add_callback(
         callback=router.handle_request,
-        url=re.compile(rf"^{joint_fixture.config.ekss_base_url}.*"),
+        url=ekss_url_pattern(joint_fixture.config.ekss_base_url),
     )
 
     example_file = populated_fixture.example_file
@@ -177,7 +176,7 @@ async def test_happy_deletion(
     # explicitly handle ekss API calls (and name unintercepted hosts above)
     httpx_mock.add_callback(
         callback=router.handle_request,
-        url=re.compile(rf"^{joint_fixture.config.ekss_base_url}.*"),
+        url=ekss_url_pattern(joint_fixture.config.ekss_base_url),
     )
 
     drs_id = populated_fixture.example_file.file_id